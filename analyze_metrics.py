@@ -4,14 +4,94 @@ Comprehensive Metrics Analysis and Comparison Tool
 Analyzes benchmark results and generates deep insights
 """
 import json
+import os
 import sys
 from collections import defaultdict
-from typing import Dict, List, Any
+from operator import itemgetter
+from typing import Dict, List, Any, Iterator, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Payload complexities reported, in display order
+COMPLEXITIES = ('SMALL', 'MEDIUM', 'LARGE', 'HUGE')
+COMPLEXITY_IDX = {complexity: i for i, complexity in enumerate(COMPLEXITIES)}
+
+# Results files at least this large are streamed with ijson (when installed)
+# instead of being loaded whole; smaller files load fastest in one parse
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+
+
+def _build_value(events) -> Any:
+    """Build the next complete JSON value from an ijson event stream"""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    for _, event, value in events:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+
+
+def _read_header(filename: str) -> Dict:
+    """
+    Read every top-level key except 'results' in one event pass; the
+    'results' object is stepped over without being built
+    """
+    header = {}
+    try:
+        with open(filename, 'rb') as f:
+            events = ijson.parse(f, use_float=True)
+            for prefix, event, value in events:
+                if prefix != '' or event != 'map_key':
+                    continue
+                if value != 'results':
+                    header[value] = _build_value(events)
+                    continue
+                for results_prefix, results_event, _ in events:
+                    if results_prefix == 'results' and results_event in ('end_map', 'end_array'):
+                        break
+    except ijson.JSONError as e:
+        print(f"❌ Error: Invalid JSON in '{filename}': {e}")
+        sys.exit(1)
+    return header
+
+
+def _stream_framework_results(filename: str) -> Iterator[Tuple[str, Dict]]:
+    """Yield (fw_key, fw_data) pairs from the top-level 'results' object one framework at a time"""
+    with open(filename, 'rb') as f:
+        try:
+            yield from ijson.kvitems(f, 'results', use_float=True)
+        except ijson.JSONError as e:
+            print(f"❌ Error: Invalid JSON in '{filename}': {e}")
+            sys.exit(1)
 
 
 def load_benchmark_results(filename: str) -> Dict:
-    """Load benchmark results from JSON file"""
+    """
+    Load benchmark results from JSON file.
+    Files of STREAM_MIN_BYTES or more are streamed when ijson is installed:
+    the other top-level keys are read up front, and 'results' is a lazy
+    stream of (fw_key, fw_data) pairs that opens the file when iterated.
+    """
     try:
+        if ijson is not None and os.path.getsize(filename) >= STREAM_MIN_BYTES:
+            results = _read_header(filename)
+            results['results'] = _stream_framework_results(filename)
+            return results
+        if orjson is not None:
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filename, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
@@ -22,63 +102,98 @@ def load_benchmark_results(filename: str) -> Dict:
         sys.exit(1)
 
 
+def _aggregate_framework(item: Tuple[str, Dict]) -> Tuple[str, Dict, List[float], List[int]]:
+    """
+    Aggregate one framework's tests.
+    Returns (fw_key, fw_stats, complexity_totals, complexity_counts) where the
+    last two hold wall clock totals and test counts indexed by COMPLEXITY_IDX.
+    """
+    fw_key, fw_data = item
+    tests = fw_data['tests']
+
+    # Single pass over the tests: success count, metric totals and
+    # complexity buckets are all accumulated as each test is visited
+    successful_count = 0
+    wall_total = ser_total = deser_total = payload_total = 0
+    complexity_totals = [0.0] * len(COMPLEXITIES)
+    complexity_counts = [0] * len(COMPLEXITIES)
+    for test_data in tests.values():
+        if not test_data['success']:
+            continue
+        result = test_data['result']
+        wall_time = result.get('wall_clock_time_ms', 0)
+        wall_total += wall_time
+        ser_total += result.get('serializationTimeMs', 0)
+        deser_total += result.get('deserializationTimeMs', 0)
+        payload_total += result.get('serializedSizeBytes', 0)
+        complexity = COMPLEXITY_IDX.get(test_data['scenario']['complexity'])
+        if complexity is not None:
+            complexity_totals[complexity] += wall_time
+            complexity_counts[complexity] += 1
+        successful_count += 1
+
+    if successful_count:
+        avg_wall_time = wall_total / successful_count
+        avg_ser_time = ser_total / successful_count
+        avg_deser_time = deser_total / successful_count
+        avg_payload = payload_total / successful_count
+    else:
+        avg_wall_time = avg_ser_time = avg_deser_time = avg_payload = 0
+
+    fw_stats = {
+        'name': fw_data['name'],
+        'category': fw_data['category'],
+        'total_tests': len(tests),
+        'successful_tests': successful_count,
+        'failed_tests': len(tests) - successful_count,
+        'success_rate': (successful_count / len(tests) * 100) if tests else 0,
+        'avg_wall_clock_ms': avg_wall_time,
+        'avg_serialization_ms': avg_ser_time,
+        'avg_deserialization_ms': avg_deser_time,
+        'avg_payload_bytes': avg_payload
+    }
+    return fw_key, fw_stats, complexity_totals, complexity_counts
+
+
 def calculate_aggregates(results: Dict) -> Dict[str, Any]:
     """Calculate aggregate statistics across all frameworks"""
     aggregates = {
         'by_framework': {},
-        'by_complexity': defaultdict(lambda: {'frameworks': [], 'avg_time': 0, 'success_rate': 0}),
+        'by_complexity': {},
         'by_category': defaultdict(lambda: {'frameworks': [], 'avg_time': 0, 'success_rate': 0}),
         'overall_stats': {}
     }
 
+    # Wall clock totals and successful test counts, indexed by COMPLEXITY_IDX
+    complexity_totals = [0.0] * len(COMPLEXITIES)
+    complexity_counts = [0] * len(COMPLEXITIES)
+
+    # Streamed results are aggregated as they arrive
+    framework_results = results['results']
+    if isinstance(framework_results, dict):
+        framework_results = framework_results.items()
+    framework_aggregates = map(_aggregate_framework, framework_results)
+
     # Analyze each framework
-    for fw_key, fw_data in results['results'].items():
-        fw_name = fw_data['name']
-        fw_category = fw_data['category']
-        tests = fw_data['tests']
-
-        successful_tests = [t for t in tests.values() if t['success']]
-        failed_tests = [t for t in tests.values() if not t['success']]
-
-        if successful_tests:
-            avg_wall_time = sum(t['result'].get('wall_clock_time_ms', 0) for t in successful_tests) / len(successful_tests)
-            avg_ser_time = sum(t['result'].get('serializationTimeMs', 0) for t in successful_tests) / len(successful_tests)
-            avg_deser_time = sum(t['result'].get('deserializationTimeMs', 0) for t in successful_tests) / len(successful_tests)
-            avg_payload = sum(t['result'].get('serializedSizeBytes', 0) for t in successful_tests) / len(successful_tests)
-        else:
-            avg_wall_time = avg_ser_time = avg_deser_time = avg_payload = 0
-
-        aggregates['by_framework'][fw_key] = {
-            'name': fw_name,
-            'category': fw_category,
-            'total_tests': len(tests),
-            'successful_tests': len(successful_tests),
-            'failed_tests': len(failed_tests),
-            'success_rate': (len(successful_tests) / len(tests) * 100) if tests else 0,
-            'avg_wall_clock_ms': avg_wall_time,
-            'avg_serialization_ms': avg_ser_time,
-            'avg_deserialization_ms': avg_deser_time,
-            'avg_payload_bytes': avg_payload
-        }
-
-        # Group by complexity
-        for test_id, test_data in tests.items():
-            if test_data['success']:
-                complexity = test_data['scenario']['complexity']
-                aggregates['by_complexity'][complexity]['frameworks'].append(fw_name)
-                if 'wall_clock_time_ms' in test_data['result']:
-                    aggregates['by_complexity'][complexity]['avg_time'] += test_data['result']['wall_clock_time_ms']
+    for fw_key, fw_stats, fw_complexity_totals, fw_complexity_counts in framework_aggregates:
+        aggregates['by_framework'][fw_key] = fw_stats
+        complexity_totals = [total + value for total, value in zip(complexity_totals, fw_complexity_totals)]
+        complexity_counts = [count + value for count, value in zip(complexity_counts, fw_complexity_counts)]
 
         # Group by category
-        if successful_tests:
-            aggregates['by_category'][fw_category]['frameworks'].append(fw_name)
-            aggregates['by_category'][fw_category]['avg_time'] += avg_wall_time
+        if fw_stats['successful_tests']:
+            category_data = aggregates['by_category'][fw_stats['category']]
+            category_data['frameworks'].append(fw_stats['name'])
+            category_data['avg_time'] += fw_stats['avg_wall_clock_ms']
 
     # Calculate complexity averages
-    for complexity_data in aggregates['by_complexity'].values():
-        if complexity_data['frameworks']:
-            complexity_data['avg_time'] /= len(complexity_data['frameworks'])
-            complexity_data['success_rate'] = 100.0
+    for complexity, total, count in zip(COMPLEXITIES, complexity_totals, complexity_counts):
+        if count:
+            aggregates['by_complexity'][complexity] = {
+                'test_count': count,
+                'avg_time': total / count,
+                'success_rate': 100.0
+            }
 
     # Calculate category averages
     for category_data in aggregates['by_category'].values():
@@ -88,90 +203,103 @@ def calculate_aggregates(results: Dict) -> Dict[str, Any]:
     return aggregates
 
 
+def _write_lines(lines: List[str]):
+    """Emit a block of report lines with a single stdout write"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    lines.clear()
+
+
 def print_comparison_report(results: Dict, aggregates: Dict):
     """Print comprehensive comparison report"""
-    print("=" * 100)
-    print("📊 COMPREHENSIVE METRICS ANALYSIS & COMPARISON REPORT")
-    print("=" * 100)
-    print()
+    out = []
+    out.append("=" * 100)
+    out.append("📊 COMPREHENSIVE METRICS ANALYSIS & COMPARISON REPORT")
+    out.append("=" * 100)
+    out.append("")
 
     # Overall statistics
-    print("🎯 OVERALL STATISTICS")
-    print("-" * 100)
-    print(f"Total Frameworks Tested: {results['healthy_frameworks']}/{results['total_frameworks']}")
-    print(f"Unhealthy Frameworks: {', '.join(results['unhealthy_frameworks']) if results['unhealthy_frameworks'] else 'None'}")
-    print(f"Test Scenarios: {len(results['scenarios'])}")
-    print(f"Benchmark Configurations: {len(results['benchmark_configs'])}")
-    print()
+    out.append("🎯 OVERALL STATISTICS")
+    out.append("-" * 100)
+    out.append(f"Total Frameworks Tested: {results['healthy_frameworks']}/{results['total_frameworks']}")
+    out.append(f"Unhealthy Frameworks: {', '.join(results['unhealthy_frameworks']) if results['unhealthy_frameworks'] else 'None'}")
+    out.append(f"Test Scenarios: {len(results['scenarios'])}")
+    out.append(f"Benchmark Configurations: {len(results['benchmark_configs'])}")
+    out.append("")
+    _write_lines(out)
 
     # Framework rankings by performance
-    print("🏆 FRAMEWORK RANKINGS (by Average Response Time)")
-    print("-" * 100)
-    sorted_frameworks = sorted(
-        aggregates['by_framework'].items(),
-        key=lambda x: x[1]['avg_wall_clock_ms'] if x[1]['successful_tests'] > 0 else float('inf')
+    out.append("🏆 FRAMEWORK RANKINGS (by Average Response Time)")
+    out.append("-" * 100)
+    # Only frameworks with successful tests are ranked or detailed below
+    ranked_frameworks = sorted(
+        (fw_stats for fw_stats in aggregates['by_framework'].values() if fw_stats['successful_tests'] > 0),
+        key=itemgetter('avg_wall_clock_ms')
     )
 
-    print(f"{'Rank':<6} {'Framework':<25} {'Category':<20} {'Avg Time':<12} {'Success Rate':<12} {'Payload Size'}")
-    print("-" * 100)
+    out.append(f"{'Rank':<6} {'Framework':<25} {'Category':<20} {'Avg Time':<12} {'Success Rate':<12} {'Payload Size'}")
+    out.append("-" * 100)
 
-    for rank, (fw_key, fw_stats) in enumerate(sorted_frameworks, 1):
-        if fw_stats['successful_tests'] > 0:
-            print(f"{rank:<6} {fw_stats['name']:<25} {fw_stats['category']:<20} "
-                  f"{fw_stats['avg_wall_clock_ms']:>10.1f}ms {fw_stats['success_rate']:>10.1f}% "
-                  f"{fw_stats['avg_payload_bytes']:>10.0f}B")
+    out.extend(
+        f"{rank:<6} {fw_stats['name']:<25} {fw_stats['category']:<20} "
+        f"{fw_stats['avg_wall_clock_ms']:>10.1f}ms {fw_stats['success_rate']:>10.1f}% "
+        f"{fw_stats['avg_payload_bytes']:>10.0f}B"
+        for rank, fw_stats in enumerate(ranked_frameworks, 1)
+    )
 
-    print()
+    out.append("")
+    _write_lines(out)
 
     # Performance by complexity
-    print("📏 PERFORMANCE BY PAYLOAD COMPLEXITY")
-    print("-" * 100)
-    print(f"{'Complexity':<12} {'Avg Time':<15} {'Tested Frameworks'}")
-    print("-" * 100)
+    out.append("📏 PERFORMANCE BY PAYLOAD COMPLEXITY")
+    out.append("-" * 100)
+    out.append(f"{'Complexity':<12} {'Avg Time':<15} {'Tested Frameworks'}")
+    out.append("-" * 100)
 
-    for complexity in ['SMALL', 'MEDIUM', 'LARGE', 'HUGE']:
+    for complexity in COMPLEXITIES:
         if complexity in aggregates['by_complexity']:
             data = aggregates['by_complexity'][complexity]
-            print(f"{complexity:<12} {data['avg_time']:>12.1f}ms {len(data['frameworks']):<3} frameworks")
+            out.append(f"{complexity:<12} {data['avg_time']:>12.1f}ms {data['test_count']:<3} frameworks")
 
-    print()
+    out.append("")
+    _write_lines(out)
 
     # Performance by category
-    print("🎨 PERFORMANCE BY FRAMEWORK CATEGORY")
-    print("-" * 100)
+    out.append("🎨 PERFORMANCE BY FRAMEWORK CATEGORY")
+    out.append("-" * 100)
     sorted_categories = sorted(
-        aggregates['by_category'].items(),
-        key=lambda x: x[1]['avg_time']
+        ((data['avg_time'], category, data) for category, data in aggregates['by_category'].items()),
+        key=itemgetter(0)
     )
 
-    print(f"{'Category':<25} {'Avg Time':<15} {'Frameworks'}")
-    print("-" * 100)
+    out.append(f"{'Category':<25} {'Avg Time':<15} {'Frameworks'}")
+    out.append("-" * 100)
 
-    for category, data in sorted_categories:
-        print(f"{category:<25} {data['avg_time']:>12.1f}ms {', '.join(data['frameworks'][:3])}")
+    for _, category, data in sorted_categories:
+        out.append(f"{category:<25} {data['avg_time']:>12.1f}ms {', '.join(data['frameworks'][:3])}")
         if len(data['frameworks']) > 3:
-            print(f"{'':25} {'':<15} {', '.join(data['frameworks'][3:])}")
+            out.append(f"{'':25} {'':<15} {', '.join(data['frameworks'][3:])}")
 
-    print()
+    out.append("")
+    _write_lines(out)
 
     # Detailed metrics per framework
-    print("📋 DETAILED FRAMEWORK METRICS")
-    print("=" * 100)
-
-    for fw_key, fw_stats in sorted_frameworks:
-        if fw_stats['successful_tests'] > 0:
-            print(f"\n{fw_stats['name']} ({fw_stats['category']})")
-            print("-" * 100)
-            print(f"  Success Rate:           {fw_stats['success_rate']:.1f}% ({fw_stats['successful_tests']}/{fw_stats['total_tests']} tests)")
-            print(f"  Avg Wall Clock Time:    {fw_stats['avg_wall_clock_ms']:.2f}ms")
-            print(f"  Avg Serialization:      {fw_stats['avg_serialization_ms']:.2f}ms")
-            print(f"  Avg Deserialization:    {fw_stats['avg_deserialization_ms']:.2f}ms")
-            print(f"  Avg Payload Size:       {fw_stats['avg_payload_bytes']:.0f} bytes")
-
-    print()
-    print("=" * 100)
-    print("✅ ANALYSIS COMPLETE")
-    print("=" * 100)
+    out.append("📋 DETAILED FRAMEWORK METRICS")
+    out.append("=" * 100)
+
+    for fw_stats in ranked_frameworks:
+        out.append(f"\n{fw_stats['name']} ({fw_stats['category']})")
+        out.append("-" * 100)
+        out.append(f"  Success Rate:           {fw_stats['success_rate']:.1f}% ({fw_stats['successful_tests']}/{fw_stats['total_tests']} tests)")
+        out.append(f"  Avg Wall Clock Time:    {fw_stats['avg_wall_clock_ms']:.2f}ms")
+        out.append(f"  Avg Serialization:      {fw_stats['avg_serialization_ms']:.2f}ms")
+        out.append(f"  Avg Deserialization:    {fw_stats['avg_deserialization_ms']:.2f}ms")
+        out.append(f"  Avg Payload Size:       {fw_stats['avg_payload_bytes']:.0f} bytes")
+
+    out.append("")
+    out.append("=" * 100)
+    out.append("✅ ANALYSIS COMPLETE")
+    out.append("=" * 100)
+    _write_lines(out)
 
 
 def main():
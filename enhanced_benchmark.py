@@ -9,16 +9,26 @@ Comprehensive metrics collection with multiple measurement phases:
 - JVM performance metrics
 """
 
+import argparse
 import json
-import subprocess
+import os
+import socket
 import sys
+import threading
 import time
 import psutil
-import statistics
+import requests
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Framework configuration (13 working frameworks)
 FRAMEWORKS = {
@@ -102,6 +112,14 @@ FRAMEWORKS = {
     }
 }
 
+# Shared keep-alive HTTP session, pooling one connection per service port
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=len(FRAMEWORKS),
+    pool_maxsize=len(FRAMEWORKS),
+    max_retries=0
+))
+
 # Comprehensive test scenarios
 SCENARIOS = [
     {'complexity': 'SMALL', 'iterations': 100, 'description': '~1KB payload, 100 iterations'},
@@ -130,8 +148,24 @@ BENCHMARK_CONFIGS = [
     }
 ]
 
+# Encoded request bodies by (complexity, config name); identical for every framework
+PAYLOADS: Dict[Tuple[str, str], bytes] = {
+    (scenario['complexity'], bench_config['name']): json.dumps({
+        'complexity': scenario['complexity'],
+        'iterations': scenario['iterations'],
+        **bench_config
+    }).encode()
+    for scenario in SCENARIOS
+    for bench_config in BENCHMARK_CONFIGS
+}
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Per-result metrics are immutable and slotted where supported (slots= needs Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class NetworkMetrics:
     """Network handshake and connection metrics"""
     connection_time_ms: float
@@ -140,8 +174,17 @@ class NetworkMetrics:
     tls_handshake_ms: float
     total_handshake_ms: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'connection_time_ms': self.connection_time_ms,
+            'dns_lookup_ms': self.dns_lookup_ms,
+            'tcp_connect_ms': self.tcp_connect_ms,
+            'tls_handshake_ms': self.tls_handshake_ms,
+            'total_handshake_ms': self.total_handshake_ms
+        }
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SerializationMetrics:
     """Serialization/deserialization performance metrics"""
     avg_serialization_time_ms: float
@@ -152,8 +195,19 @@ class SerializationMetrics:
     p99_serialization_time_ms: float
     throughput_ops_per_sec: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'avg_serialization_time_ms': self.avg_serialization_time_ms,
+            'min_serialization_time_ms': self.min_serialization_time_ms,
+            'max_serialization_time_ms': self.max_serialization_time_ms,
+            'p50_serialization_time_ms': self.p50_serialization_time_ms,
+            'p95_serialization_time_ms': self.p95_serialization_time_ms,
+            'p99_serialization_time_ms': self.p99_serialization_time_ms,
+            'throughput_ops_per_sec': self.throughput_ops_per_sec
+        }
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ResourceMetrics:
     """Resource utilization metrics"""
     cpu_percent: float
@@ -164,8 +218,19 @@ class ResourceMetrics:
     gc_time_ms: float
     thread_count: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'cpu_percent': self.cpu_percent,
+            'memory_mb': self.memory_mb,
+            'memory_delta_mb': self.memory_delta_mb,
+            'peak_memory_mb': self.peak_memory_mb,
+            'gc_count': self.gc_count,
+            'gc_time_ms': self.gc_time_ms,
+            'thread_count': self.thread_count
+        }
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TransportMetrics:
     """Transport efficiency metrics"""
     avg_payload_size_bytes: float
@@ -173,8 +238,16 @@ class TransportMetrics:
     network_throughput_mbps: float
     overhead_percent: float
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'avg_payload_size_bytes': self.avg_payload_size_bytes,
+            'compression_ratio': self.compression_ratio,
+            'network_throughput_mbps': self.network_throughput_mbps,
+            'overhead_percent': self.overhead_percent
+        }
+
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ComprehensiveMetrics:
     """All metrics for a single test run"""
     framework: str
@@ -187,200 +260,362 @@ class ComprehensiveMetrics:
     success: bool
     error: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain nested dict of the result, as written to the results files"""
+        return {
+            'framework': self.framework,
+            'scenario': self.scenario,
+            'config': self.config,
+            'network': self.network.to_dict(),
+            'serialization': self.serialization.to_dict(),
+            'resource': self.resource.to_dict(),
+            'transport': self.transport.to_dict(),
+            'success': self.success,
+            'error': self.error
+        }
+
+
+# Zero-valued metrics shared by every failed result
+_ZERO_SER = SerializationMetrics(0, 0, 0, 0, 0, 0, 0)
+_ZERO_RES = ResourceMetrics(0, 0, 0, 0, 0, 0, 0)
+_ZERO_TRANS = TransportMetrics(0, 0, 0, 0)
 
-def measure_network_handshake(url: str) -> NetworkMetrics:
+
+# Spring Boot actuator health endpoint, served by every framework service
+HEALTH_PATH = '/actuator/health'
+
+
+def measure_network_handshake(host: str, port: int) -> NetworkMetrics:
     """
-    Measure network handshake performance using curl timing
+    Measure DNS lookup and TCP connect time to a service, and the total time
+    of a health check GET over that connection. All service endpoints are
+    plain HTTP, so there is no TLS handshake.
     """
+    request = f"GET {HEALTH_PATH} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n".encode()
     try:
-        # Use curl to measure detailed timing
-        result = subprocess.run([
-            'curl', '-s', '-o', '/dev/null', '-w',
-            '%{time_namelookup},%{time_connect},%{time_appconnect},%{time_pretransfer},%{time_total}',
-            url
-        ], capture_output=True, text=True, timeout=10)
-
-        if result.returncode == 0:
-            times = [float(x) * 1000 for x in result.stdout.split(',')]  # Convert to ms
-            dns_lookup = times[0]
-            tcp_connect = times[1] - times[0]
-            tls_handshake = times[2] - times[1] if times[2] > 0 else 0
-            total = times[4]
-
-            return NetworkMetrics(
-                connection_time_ms=times[1],
-                dns_lookup_ms=dns_lookup,
-                tcp_connect_ms=tcp_connect,
-                tls_handshake_ms=tls_handshake,
-                total_handshake_ms=total
-            )
-    except Exception as e:
+        start_ns = time.perf_counter_ns()
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        resolved_ns = time.perf_counter_ns()
+    except OSError as e:
         print(f"    ⚠️  Network measurement failed: {e}")
+        # Return default metrics on failure
+        return NetworkMetrics(0, 0, 0, 0, 0)
 
-    # Return default metrics on failure
-    return NetworkMetrics(0, 0, 0, 0, 0)
+    # Like curl and requests, fall through to the next address when one is
+    # refused (e.g. localhost resolving to ::1 for an IPv4-only service)
+    for family, sock_type, proto, _, address in addresses:
+        try:
+            with socket.socket(family, sock_type, proto) as sock:
+                sock.settimeout(10)
+                sock.connect(address)
+                connected_ns = time.perf_counter_ns()
+                sock.sendall(request)
+                while sock.recv(65536):
+                    pass  # Read until the service closes the connection
+                finished_ns = time.perf_counter_ns()
+            break
+        except OSError as e:
+            error = e
+    else:
+        print(f"    ⚠️  Network measurement failed: {error}")
+        return NetworkMetrics(0, 0, 0, 0, 0)
+
+    dns_lookup = (resolved_ns - start_ns) / 1e6
+    tcp_connect = (connected_ns - resolved_ns) / 1e6
+    return NetworkMetrics(
+        connection_time_ms=dns_lookup + tcp_connect,
+        dns_lookup_ms=dns_lookup,
+        tcp_connect_ms=tcp_connect,
+        tls_handshake_ms=0,
+        total_handshake_ms=(finished_ns - start_ns) / 1e6
+    )
+
+
+# Java service process by listening port, filled once after the health check
+_PORT_TO_PROC: Dict[int, psutil.Process] = {}
+
+
+def _find_java_pids_by_port(ports: Set[int]) -> Dict[int, int]:
+    """
+    Map listening ports to Java PIDs from /proc (Linux): /proc/net/tcp{,6}
+    gives the socket inode per port, and only Java processes' fd links are
+    searched for those inodes
+    """
+    inode_to_port = {}
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as f:
+                next(f)  # Column header
+                for line in f:
+                    fields = line.split()
+                    port = int(fields[1].rsplit(':', 1)[1], 16)
+                    if fields[3] == '0A' and port in ports:  # 0A = LISTEN
+                        inode_to_port[f"socket:[{fields[9]}]"] = port
+        except OSError:
+            continue
+
+    pids = {}
+    if not inode_to_port:
+        return pids
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        fd_dir = f"/proc/{pid}/fd"
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                if 'java' not in f.read().lower():
+                    continue
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                port = inode_to_port.get(os.readlink(f"{fd_dir}/{fd}"))
+            except OSError:
+                continue
+            if port is not None:
+                pids[port] = int(pid)
+    return pids
 
 
-def get_process_info(port: int) -> Optional[psutil.Process]:
-    """Find the Java process running on the specified port"""
+def cache_service_processes(ports: Iterable[int]) -> None:
+    """
+    Map service ports to their Java processes once per run; service PIDs
+    do not change during a run. Reads /proc directly on Linux, elsewhere
+    scans the system connection table through psutil
+    """
+    wanted = set(ports)
+    if os.path.exists('/proc/net/tcp'):
+        for port, pid in _find_java_pids_by_port(wanted).items():
+            try:
+                _PORT_TO_PROC[port] = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                continue
+        return
+
     try:
-        for proc in psutil.process_iter(['pid', 'name', 'connections']):
+        connections = psutil.net_connections(kind='inet')
+    except psutil.AccessDenied:
+        # Some platforms (e.g. macOS) need root for the system-wide table
+        connections = []
+        for proc in psutil.process_iter(['name']):
             try:
                 if proc.info['name'] and 'java' in proc.info['name'].lower():
-                    connections = proc.connections()
-                    for conn in connections:
-                        if hasattr(conn, 'laddr') and conn.laddr.port == port:
-                            return proc
+                    # net_connections() replaced connections() in psutil 6
+                    proc_connections = getattr(proc, 'net_connections', proc.connections)
+                    for conn in proc_connections(kind='inet'):
+                        if conn.laddr and conn.laddr.port in wanted:
+                            _PORT_TO_PROC[conn.laddr.port] = proc
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-    except Exception:
-        pass
-    return None
+
+    for conn in connections:
+        if not conn.pid or not conn.laddr or conn.laddr.port not in wanted:
+            continue
+        if conn.status != psutil.CONN_LISTEN or conn.laddr.port in _PORT_TO_PROC:
+            continue
+        try:
+            proc = psutil.Process(conn.pid)
+            if 'java' in proc.name().lower():
+                _PORT_TO_PROC[conn.laddr.port] = proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
 
 
-def measure_resource_utilization(port: int, duration_sec: float = 1.0) -> ResourceMetrics:
+def get_process_info(port: int) -> Optional[psutil.Process]:
+    """Find the Java process running on the specified port"""
+    return _PORT_TO_PROC.get(port)
+
+
+class ResourceSampler(threading.Thread):
     """
-    Measure CPU, memory, and thread utilization for the service
+    Background thread polling one service process at a fixed rate; each
+    sample is (perf_counter_ns time, CPU %, RSS bytes, thread count)
     """
+
+    def __init__(self, proc: psutil.Process, interval_sec: float = 0.1):
+        super().__init__(daemon=True)
+        self.proc = proc
+        self.interval_sec = interval_sec
+        self.samples = deque(maxlen=1024)
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            self.proc.cpu_percent(interval=None)  # First call only primes the counter
+            while True:
+                self.samples.append((
+                    time.perf_counter_ns(),
+                    self.proc.cpu_percent(interval=None),
+                    self.proc.memory_info().rss,
+                    self.proc.num_threads()
+                ))
+                if self._stop_event.wait(self.interval_sec):
+                    break
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            print(f"    ⚠️  Resource sampling stopped: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+# Running resource samplers by service port
+_SAMPLERS: Dict[int, ResourceSampler] = {}
+
+
+def start_resource_sampler(port: int) -> None:
+    """Start a background sampler for the service on `port`, if its process is known"""
     proc = get_process_info(port)
+    if proc:
+        _SAMPLERS[port] = ResourceSampler(proc)
+        _SAMPLERS[port].start()
 
-    if not proc:
-        return ResourceMetrics(0, 0, 0, 0, 0, 0, 0)
 
-    try:
-        # Initial snapshot
-        cpu_percent_start = proc.cpu_percent(interval=0.1)
-        mem_info_start = proc.memory_info()
-        num_threads_start = proc.num_threads()
-
-        # Wait for operation to complete
-        time.sleep(duration_sec)
-
-        # Final snapshot
-        cpu_percent = proc.cpu_percent(interval=0.1)
-        mem_info = proc.memory_info()
-        num_threads = proc.num_threads()
-
-        memory_mb = mem_info.rss / (1024 * 1024)
-        memory_delta_mb = (mem_info.rss - mem_info_start.rss) / (1024 * 1024)
-
-        return ResourceMetrics(
-            cpu_percent=cpu_percent,
-            memory_mb=memory_mb,
-            memory_delta_mb=memory_delta_mb,
-            peak_memory_mb=memory_mb,  # Approximate
-            gc_count=0,  # Would need JMX
-            gc_time_ms=0,  # Would need JMX
-            thread_count=num_threads
-        )
-    except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-        print(f"    ⚠️  Resource measurement failed: {e}")
+def stop_resource_sampler(port: int) -> None:
+    """Stop the background sampler for the service on `port`, if one is running"""
+    sampler = _SAMPLERS.pop(port, None)
+    if sampler is not None:
+        sampler.stop()
+
+
+# Between tests, wait up to IDLE_MAX_WAIT_SEC for service CPU to drop below IDLE_CPU_PERCENT
+IDLE_CPU_PERCENT = 5.0
+IDLE_MAX_WAIT_SEC = 0.3
+
+
+def wait_for_service_idle(port: int, poll_sec: float = 0.05) -> None:
+    """
+    Block until the service's two latest CPU samples are below
+    IDLE_CPU_PERCENT or IDLE_MAX_WAIT_SEC has passed; without a sampler
+    the full wait is used
+    """
+    sampler = _SAMPLERS.get(port)
+    if sampler is None:
+        time.sleep(IDLE_MAX_WAIT_SEC)
+        return
+
+    deadline = time.monotonic() + IDLE_MAX_WAIT_SEC
+    while True:
+        try:
+            if sampler.samples[-1][1] < IDLE_CPU_PERCENT and sampler.samples[-2][1] < IDLE_CPU_PERCENT:
+                return
+        except IndexError:
+            pass  # Fewer than two samples so far
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(poll_sec, remaining))
+
+
+def measure_resource_utilization(port: int, since: int) -> ResourceMetrics:
+    """
+    Summarize CPU, memory, and thread utilization for the service from the
+    samples taken since `since` (a time.perf_counter_ns() value)
+    """
+    sampler = _SAMPLERS.get(port)
+    samples = list(sampler.samples) if sampler else []
+    if not samples:
         return ResourceMetrics(0, 0, 0, 0, 0, 0, 0)
 
+    # Fall back to the latest sample when the window is shorter than the interval
+    window = [sample for sample in samples if sample[0] >= since] or samples[-1:]
+    first_rss = window[0][2]
+    _, _, last_rss, last_threads = window[-1]
+
+    return ResourceMetrics(
+        cpu_percent=max(sample[1] for sample in window),
+        memory_mb=last_rss / (1024 * 1024),
+        memory_delta_mb=(last_rss - first_rss) / (1024 * 1024),
+        peak_memory_mb=max(sample[2] for sample in window) / (1024 * 1024),
+        gc_count=0,  # Would need JMX
+        gc_time_ms=0,  # Would need JMX
+        thread_count=last_threads
+    )
+
+
+# Actuator health documents lead with the overall status, so only the head is scanned
+HEALTH_SCAN_BYTES = 128
+ACCEPT_JSON_HEADERS = {'Accept': 'application/json'}
+
 
 def check_service_health(framework_key: str, config: Dict) -> bool:
     """Check if a service is healthy"""
     port = config['port']
     try:
-        result = subprocess.run(
-            ["curl", "-s", f"http://localhost:{port}/actuator/health"],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        return '"status":"UP"' in result.stdout
-    except:
+        response = SESSION.get(f"http://localhost:{port}{HEALTH_PATH}",
+                               headers=ACCEPT_JSON_HEADERS, timeout=2)
+    except requests.RequestException:
+        return False
+
+    head = response.content[:HEALTH_SCAN_BYTES]
+    key = head.find(b'"status"')
+    if key != -1:
+        # First "status" key is the overall one; later ones belong to components
+        return head[key + len(b'"status"'):].lstrip(b' \t\r\n:').startswith(b'"UP"')
+    try:
+        health = response.json()
+    except ValueError:
         return False
+    return isinstance(health, dict) and health.get('status') == 'UP'
+
+
+def _fail(
+    fw_config: Dict,
+    scenario: Dict,
+    bench_config: Dict,
+    network_metrics: NetworkMetrics,
+    error: str
+) -> ComprehensiveMetrics:
+    """Build the result for a failed test"""
+    return ComprehensiveMetrics(
+        fw_config['name'], scenario['complexity'], bench_config['name'],
+        network_metrics, _ZERO_SER, _ZERO_RES, _ZERO_TRANS, False, error
+    )
 
 
 def run_enhanced_benchmark(
     framework_key: str,
     fw_config: Dict,
     scenario: Dict,
-    bench_config: Dict
-) -> ComprehensiveMetrics:
+    bench_config: Dict,
+    payload_bytes: bytes,
+    network_metrics: NetworkMetrics
+) -> Tuple[ComprehensiveMetrics, bool]:
     """
-    Run comprehensive benchmark with all metrics phases
+    Run comprehensive benchmark with all metrics phases. Returns the result
+    and whether the request itself failed (timeout or connection error)
     """
     port = fw_config['port']
     endpoint = fw_config['v2_endpoint']
     url = f"http://localhost:{port}{endpoint}"
 
-    # Phase 1: Network Handshake Metrics
-    network_metrics = measure_network_handshake(f"http://localhost:{port}/actuator/health")
+    # Phase 1: Network handshake metrics are measured once per service, at health check
 
-    # Phase 2: Resource Baseline
-    resource_before = measure_resource_utilization(port, 0.1)
+    # Phase 2: Resource samples taken from here on belong to this test
+    window_start = time.perf_counter_ns()
 
     # Phase 3: Execute Benchmark
-    payload = {
-        'complexity': scenario['complexity'],
-        'iterations': scenario['iterations'],
-        **bench_config
-    }
-
     serialization_times = []
     payload_sizes = []
 
     try:
-        start_time = time.time()
-        result = subprocess.run(
-            ["curl", "-s", "-X", "POST", url,
-             "-H", "Content-Type: application/json",
-             "-d", json.dumps(payload)],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
-        end_time = time.time()
-
-        if result.returncode != 0:
-            return ComprehensiveMetrics(
-                framework=fw_config['name'],
-                scenario=scenario['complexity'],
-                config=bench_config['name'],
-                network=network_metrics,
-                serialization=SerializationMetrics(0, 0, 0, 0, 0, 0, 0),
-                resource=ResourceMetrics(0, 0, 0, 0, 0, 0, 0),
-                transport=TransportMetrics(0, 0, 0, 0),
-                success=False,
-                error=f"curl failed: {result.stderr[:100]}"
-            )
+        start_ns = time.perf_counter_ns()
+        response = SESSION.post(url, data=payload_bytes, headers=JSON_HEADERS, timeout=180)
+        wall_clock_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Parse response
         try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError as e:
-            return ComprehensiveMetrics(
-                framework=fw_config['name'],
-                scenario=scenario['complexity'],
-                config=bench_config['name'],
-                network=network_metrics,
-                serialization=SerializationMetrics(0, 0, 0, 0, 0, 0, 0),
-                resource=ResourceMetrics(0, 0, 0, 0, 0, 0, 0),
-                transport=TransportMetrics(0, 0, 0, 0),
-                success=False,
-                error=f"JSON parse error: {str(e)}"
-            )
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+        except ValueError as e:
+            return _fail(fw_config, scenario, bench_config, network_metrics, f"JSON parse error: {str(e)}"), False
 
         if not data.get('success', False):
-            return ComprehensiveMetrics(
-                framework=fw_config['name'],
-                scenario=scenario['complexity'],
-                config=bench_config['name'],
-                network=network_metrics,
-                serialization=SerializationMetrics(0, 0, 0, 0, 0, 0, 0),
-                resource=ResourceMetrics(0, 0, 0, 0, 0, 0, 0),
-                transport=TransportMetrics(0, 0, 0, 0),
-                success=False,
-                error=data.get('error', 'Unknown error')
-            )
+            return _fail(fw_config, scenario, bench_config, network_metrics, data.get('error', 'Unknown error')), False
 
-        # Phase 4: Resource After
-        resource_after = measure_resource_utilization(port, 0.1)
+        # Phase 4: Resource usage over the test window
+        resource_window = measure_resource_utilization(port, window_start)
 
         # Extract metrics from response
-        wall_clock_ms = (end_time - start_time) * 1000
         avg_ser_time = data.get('serializationTimeMs', data.get('averageSerializationTimeMs', 0))
         avg_size = data.get('totalSizeBytes', data.get('averageSerializedSizeBytes', 0))
         compression_ratio = data.get('averageCompressionRatio', 1.0)
@@ -400,13 +635,13 @@ def run_enhanced_benchmark(
 
         # Calculate resource metrics
         resource_metrics = ResourceMetrics(
-            cpu_percent=max(resource_before.cpu_percent, resource_after.cpu_percent),
-            memory_mb=resource_after.memory_mb,
+            cpu_percent=resource_window.cpu_percent,
+            memory_mb=resource_window.memory_mb,
             memory_delta_mb=data.get('memoryMetrics', {}).get('memoryDeltaMb', 0),
-            peak_memory_mb=data.get('memoryMetrics', {}).get('peakMemoryMb', resource_after.memory_mb),
+            peak_memory_mb=data.get('memoryMetrics', {}).get('peakMemoryMb', resource_window.peak_memory_mb),
             gc_count=0,  # Would need JMX
             gc_time_ms=0,  # Would need JMX
-            thread_count=resource_after.thread_count
+            thread_count=resource_window.thread_count
         )
 
         # Calculate transport metrics
@@ -430,56 +665,175 @@ def run_enhanced_benchmark(
             resource=resource_metrics,
             transport=transport_metrics,
             success=True
-        )
+        ), False
 
-    except subprocess.TimeoutExpired:
-        return ComprehensiveMetrics(
-            framework=fw_config['name'],
-            scenario=scenario['complexity'],
-            config=bench_config['name'],
-            network=network_metrics,
-            serialization=SerializationMetrics(0, 0, 0, 0, 0, 0, 0),
-            resource=ResourceMetrics(0, 0, 0, 0, 0, 0, 0),
-            transport=TransportMetrics(0, 0, 0, 0),
-            success=False,
-            error='Timeout (180s)'
-        )
+    except requests.Timeout:
+        return _fail(fw_config, scenario, bench_config, network_metrics, 'Timeout (180s)'), True
+    except requests.RequestException as e:
+        return _fail(fw_config, scenario, bench_config, network_metrics, f"HTTP request failed: {str(e)[:100]}"), True
     except Exception as e:
-        return ComprehensiveMetrics(
-            framework=fw_config['name'],
-            scenario=scenario['complexity'],
-            config=bench_config['name'],
-            network=network_metrics,
-            serialization=SerializationMetrics(0, 0, 0, 0, 0, 0, 0),
-            resource=ResourceMetrics(0, 0, 0, 0, 0, 0, 0),
-            transport=TransportMetrics(0, 0, 0, 0),
-            success=False,
-            error=str(e)[:200]
-        )
+        return _fail(fw_config, scenario, bench_config, network_metrics, str(e)[:200]), False
 
 
-def export_prometheus_metrics(results: List[ComprehensiveMetrics], output_path: str):
+# After this many timeouts/connection failures in a row, a service's remaining tests are skipped
+MAX_CONSECUTIVE_REQUEST_FAILURES = 2
+
+
+def run_framework_suite(
+    framework_key: str,
+    fw_config: Dict,
+    network_metrics: NetworkMetrics,
+    on_result: Callable[[Dict, Dict, Dict, ComprehensiveMetrics], None],
+    stop_event: Optional[threading.Event] = None
+) -> None:
+    """
+    Run every scenario/config pair against one framework, one at a time,
+    handing each result to `on_result`. Once the service has stopped
+    answering, the remaining pairs are recorded as skipped. Returns early
+    when `stop_event` is set.
+    """
+    # Only the framework under test is sampled, and only while its suite runs
+    start_resource_sampler(fw_config['port'])
+    try:
+        request_failures = 0
+        for scenario in SCENARIOS:
+            for bench_config in BENCHMARK_CONFIGS:
+                if stop_event is not None and stop_event.is_set():
+                    return
+                if request_failures >= MAX_CONSECUTIVE_REQUEST_FAILURES:
+                    on_result(fw_config, scenario, bench_config, _fail(
+                        fw_config, scenario, bench_config, network_metrics,
+                        f"Skipped after {request_failures} consecutive request failures"
+                    ))
+                    continue
+
+                payload_bytes = PAYLOADS[(scenario['complexity'], bench_config['name'])]
+                result, request_failed = run_enhanced_benchmark(framework_key, fw_config, scenario,
+                                                                bench_config, payload_bytes, network_metrics)
+                on_result(fw_config, scenario, bench_config, result)
+
+                if request_failed:
+                    request_failures += 1
+                else:
+                    request_failures = 0
+
+                # Let the service settle before the next test
+                wait_for_service_idle(fw_config['port'])
+    finally:
+        stop_resource_sampler(fw_config['port'])
+
+
+def encode_result_line(result: ComprehensiveMetrics) -> bytes:
+    """Encode one result as a newline-terminated JSON line"""
+    if orjson is not None:
+        return orjson.dumps(result) + b'\n'
+    return json.dumps(result.to_dict()).encode() + b'\n'
+
+
+def read_results_log(path: str) -> Iterator[ComprehensiveMetrics]:
+    """Yield the results recorded in an ndjson results log, one at a time"""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        for line in f:
+            record = loads(line)
+            yield ComprehensiveMetrics(**{
+                **record,
+                'network': NetworkMetrics(**record['network']),
+                'serialization': SerializationMetrics(**record['serialization']),
+                'resource': ResourceMetrics(**record['resource']),
+                'transport': TransportMetrics(**record['transport'])
+            })
+
+
+def write_results_json(output_path: str, header: Dict[str, Any], log_path: str):
+    """
+    Write the results JSON document: `header` fields followed by a
+    `results` array copied line by line from the ndjson results log
+    """
+    with open(output_path, 'wb') as out, open(log_path, 'rb') as log:
+        out.write(b'{')
+        for key, value in header.items():
+            value_json = json.dumps(value, indent=2).replace('\n', '\n  ')
+            out.write(f'\n  {json.dumps(key)}: {value_json},'.encode())
+        out.write(b'\n  "results": [')
+        separator = b'\n    '
+        for line in log:
+            out.write(separator + line.rstrip(b'\n'))
+            separator = b',\n    '
+        out.write(b'\n  ]\n}\n')
+
+
+def summarize_by_framework(
+    summaries: List[Tuple[str, bool, float, float]]
+) -> List[Tuple[str, float, float, int]]:
+    """
+    Mean serialization time, mean payload size and test count per framework
+    over successful tests, sorted by framework name; `summaries` holds
+    (framework, success, avg time ms, payload size bytes) per test
+    """
+    # Running [time sum, size sum, count] per framework
+    totals = defaultdict(lambda: [0.0, 0.0, 0])
+    for framework, success, avg_time, size in summaries:
+        if success:
+            framework_totals = totals[framework]
+            framework_totals[0] += avg_time
+            framework_totals[1] += size
+            framework_totals[2] += 1
+    return [
+        (name, time_sum / count, size_sum / count, count)
+        for name, (time_sum, size_sum, count) in sorted(totals.items())
+    ]
+
+
+def export_prometheus_metrics(results: Iterable[ComprehensiveMetrics], output_path: str):
     """Export metrics in Prometheus format"""
+    parts = [
+        "# HELP serialization_time_ms Average serialization time in milliseconds\n",
+        "# TYPE serialization_time_ms gauge\n"
+    ]
+
+    for result in results:
+        if result.success:
+            labels = f'framework="{result.framework}",scenario="{result.scenario}",config="{result.config}"'
+            parts.append(
+                f"serialization_time_ms{{{labels}}} {result.serialization.avg_serialization_time_ms}\n"
+                f"serialization_throughput_ops{{{labels}}} {result.serialization.throughput_ops_per_sec}\n"
+                f"payload_size_bytes{{{labels}}} {result.transport.avg_payload_size_bytes}\n"
+                f"compression_ratio{{{labels}}} {result.transport.compression_ratio}\n"
+                f"memory_usage_mb{{{labels}}} {result.resource.memory_mb}\n"
+                f"cpu_usage_percent{{{labels}}} {result.resource.cpu_percent}\n"
+            )
+
     with open(output_path, 'w') as f:
-        f.write("# HELP serialization_time_ms Average serialization time in milliseconds\n")
-        f.write("# TYPE serialization_time_ms gauge\n")
+        f.write("".join(parts))
 
-        for result in results:
-            if result.success:
-                labels = f'framework="{result.framework}",scenario="{result.scenario}",config="{result.config}"'
-                f.write(f"serialization_time_ms{{{labels}}} {result.serialization.avg_serialization_time_ms}\n")
-                f.write(f"serialization_throughput_ops{{{labels}}} {result.serialization.throughput_ops_per_sec}\n")
-                f.write(f"payload_size_bytes{{{labels}}} {result.transport.avg_payload_size_bytes}\n")
-                f.write(f"compression_ratio{{{labels}}} {result.transport.compression_ratio}\n")
-                f.write(f"memory_usage_mb{{{labels}}} {result.resource.memory_mb}\n")
-                f.write(f"cpu_usage_percent{{{labels}}} {result.resource.cpu_percent}\n")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Enhanced benchmark for Java serialization frameworks")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="frameworks to benchmark at the same time (default: 1, one after another). "
+             "Services share the host, so parallel runs make timings compete for CPU "
+             "and memory bandwidth and are not comparable with serial runs"
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    # One run timestamp names the output files and stamps the results
+    started_at = datetime.now()
+    timestamp_str = started_at.strftime('%Y%m%d_%H%M%S')
+
     print("=" * 80)
     print("🚀 ENHANCED SERIALIZATION FRAMEWORK BENCHMARK")
     print("=" * 80)
-    print(f"⏰ Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⏰ Start time: {started_at:%Y-%m-%d %H:%M:%S}")
     print(f"📊 Frameworks: {len(FRAMEWORKS)}")
     print(f"🎯 Scenarios: {len(SCENARIOS)} payload sizes")
     print(f"🔧 Configurations: {len(BENCHMARK_CONFIGS)} test configs")
@@ -497,11 +851,18 @@ def main():
     print("-" * 80)
     healthy_frameworks = {}
     unhealthy_frameworks = []
+    handshakes: Dict[str, NetworkMetrics] = {}
+
+    # Checks are independent, so they run concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(FRAMEWORKS)) as executor:
+        health = list(executor.map(lambda item: check_service_health(*item), FRAMEWORKS.items()))
 
-    for key, config in FRAMEWORKS.items():
-        if check_service_health(key, config):
+    for (key, config), is_healthy in zip(FRAMEWORKS.items(), health):
+        if is_healthy:
             print(f"✅ {config['name']:25s} (port {config['port']}): HEALTHY")
             healthy_frameworks[key] = config
+            # Connection setup cost is stable within a run, so it is measured once here
+            handshakes[key] = measure_network_handshake('localhost', config['port'])
         else:
             print(f"❌ {config['name']:25s} (port {config['port']}): UNAVAILABLE")
             unhealthy_frameworks.append(key)
@@ -514,58 +875,85 @@ def main():
         print("❌ No services available for testing!")
         return 1
 
+    cache_service_processes(config['port'] for config in healthy_frameworks.values())
+
     # Phase 2: Comprehensive Benchmarking
     print("=" * 80)
     print("Phase 2: Enhanced Metrics Collection")
     print("=" * 80)
     print()
 
-    all_results = []
     total_tests = len(healthy_frameworks) * len(SCENARIOS) * len(BENCHMARK_CONFIGS)
     current_test = 0
+    print_lock = threading.Lock()
 
-    for fw_key, fw_config in healthy_frameworks.items():
-        print(f"\n🧪 Testing: {fw_config['name']} ({fw_config['category']})")
-        print("-" * 80)
+    # Results are logged to disk as they complete; only compact
+    # (framework, success, avg time, size) summaries stay in memory
+    results_log = f"results/enhanced_benchmark_{timestamp_str}.ndjson"
+    summaries: List[Tuple[str, bool, float, float]] = []
 
-        for scenario in SCENARIOS:
-            for bench_config in BENCHMARK_CONFIGS:
+    with open(results_log, 'wb') as log:
+        def report_result(fw_config: Dict, scenario: Dict, bench_config: Dict, result: ComprehensiveMetrics):
+            nonlocal current_test
+            if result.success:
+                outcome = (f"✅ {result.serialization.avg_serialization_time_ms:.2f}ms | "
+                           f"{result.transport.avg_payload_size_bytes / 1024:.1f}KB | "
+                           f"{result.resource.cpu_percent:.1f}% CPU")
+            else:
+                outcome = f"❌ {result.error[:40]}"
+            line = encode_result_line(result)
+            with print_lock:
+                log.write(line)
+                log.flush()
+                summaries.append((result.framework, result.success,
+                                  result.serialization.avg_serialization_time_ms,
+                                  result.transport.avg_payload_size_bytes))
                 current_test += 1
-
-                print(f"  [{current_test}/{total_tests}] {scenario['complexity']:6s} | "
-                      f"{bench_config['name']:20s} ... ", end="", flush=True)
-
-                result = run_enhanced_benchmark(fw_key, fw_config, scenario, bench_config)
-                all_results.append(result)
-
-                if result.success:
-                    print(f"✅ {result.serialization.avg_serialization_time_ms:.2f}ms | "
-                          f"{result.transport.avg_payload_size_bytes / 1024:.1f}KB | "
-                          f"{result.resource.cpu_percent:.1f}% CPU")
-                else:
-                    print(f"❌ {result.error[:40]}")
-
-                # Small delay to prevent overwhelming services
-                time.sleep(0.3)
-
-    # Save results
-    timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-    # JSON output
+                print(f"  [{current_test}/{total_tests}] {fw_config['name']:20s} | {scenario['complexity']:6s} | "
+                      f"{bench_config['name']:20s} ... {outcome}")
+
+        workers = min(args.workers, len(healthy_frameworks))
+        if workers == 1:
+            print(f"🧪 Testing {len(healthy_frameworks)} frameworks one at a time")
+            print("-" * 80)
+            for fw_key, fw_config in healthy_frameworks.items():
+                run_framework_suite(fw_key, fw_config, handshakes[fw_key], report_result)
+        else:
+            # Each service still sees one test at a time
+            print(f"🧪 Testing {len(healthy_frameworks)} frameworks, {workers} in parallel")
+            print("-" * 80)
+            stop_event = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=workers)
+            suites = [
+                executor.submit(run_framework_suite, fw_key, fw_config, handshakes[fw_key],
+                                report_result, stop_event)
+                for fw_key, fw_config in healthy_frameworks.items()
+            ]
+            try:
+                for suite in suites:
+                    suite.result()
+            except KeyboardInterrupt:
+                # Suites stop before their next test; queued suites never start
+                stop_event.set()
+                for suite in suites:
+                    suite.cancel()
+                raise
+            finally:
+                executor.shutdown(wait=False)
+
+    # JSON output, assembled from the results log
     json_file = f"results/enhanced_benchmark_{timestamp_str}.json"
-    with open(json_file, 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'total_frameworks': len(FRAMEWORKS),
-            'healthy_frameworks': len(healthy_frameworks),
-            'unhealthy_frameworks': unhealthy_frameworks,
-            'total_tests': current_test,
-            'results': [asdict(r) for r in all_results]
-        }, f, indent=2)
+    write_results_json(json_file, {
+        'timestamp': started_at.isoformat(),
+        'total_frameworks': len(FRAMEWORKS),
+        'healthy_frameworks': len(healthy_frameworks),
+        'unhealthy_frameworks': unhealthy_frameworks,
+        'total_tests': current_test
+    }, results_log)
 
     # Prometheus export
     prometheus_file = f"results/metrics_{timestamp_str}.prom"
-    export_prometheus_metrics(all_results, prometheus_file)
+    export_prometheus_metrics(read_results_log(results_log), prometheus_file)
 
     # Summary statistics
     print()
@@ -573,28 +961,19 @@ def main():
     print("✅ ENHANCED BENCHMARK COMPLETE!")
     print("=" * 80)
     print(f"📁 JSON Results: {json_file}")
+    print(f"📝 Results Log: {results_log}")
     print(f"📊 Prometheus Metrics: {prometheus_file}")
     print(f"🧪 Total tests run: {current_test}")
-    print(f"✅ Successful tests: {sum(1 for r in all_results if r.success)}")
-    print(f"❌ Failed tests: {sum(1 for r in all_results if not r.success)}")
+    print(f"✅ Successful tests: {sum(1 for summary in summaries if summary[1])}")
+    print(f"❌ Failed tests: {sum(1 for summary in summaries if not summary[1])}")
     print()
 
     # Print summary by framework
     print("📊 Performance Summary by Framework:")
     print("-" * 80)
 
-    framework_stats = defaultdict(lambda: {'times': [], 'sizes': [], 'successes': 0})
-    for result in all_results:
-        if result.success:
-            framework_stats[result.framework]['times'].append(result.serialization.avg_serialization_time_ms)
-            framework_stats[result.framework]['sizes'].append(result.transport.avg_payload_size_bytes)
-            framework_stats[result.framework]['successes'] += 1
-
-    for fw_name in sorted(framework_stats.keys()):
-        stats = framework_stats[fw_name]
-        avg_time = statistics.mean(stats['times'])
-        avg_size = statistics.mean(stats['sizes'])
-        print(f"  {fw_name:25s}: {avg_time:8.2f}ms avg | {avg_size/1024:8.1f}KB avg | {stats['successes']} tests")
+    for fw_name, avg_time, avg_size, successes in summarize_by_framework(summaries):
+        print(f"  {fw_name:25s}: {avg_time:8.2f}ms avg | {avg_size/1024:8.1f}KB avg | {successes} tests")
 
     print()
     return 0
@@ -611,3 +990,5 @@ if __name__ == '__main__':
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        SESSION.close()